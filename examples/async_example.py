@@ -73,9 +73,9 @@ def wait_for_result_example():
         print(f"Email failed: {e}")
 
 
-# Example 4: Send multiple emails in parallel
+# Example 4: Send multiple emails in one request
 def batch_send_example():
-    """Send multiple emails concurrently"""
+    """Send multiple emails with a single bulk request"""
 
     recipients = [
         "user1@example.com",
@@ -83,26 +83,28 @@ def batch_send_example():
         "user3@example.com",
     ]
 
-    futures = []
-    for recipient in recipients:
-        future = sdk.send_simple_async(
-            recipient=recipient,
-            sender="noreply@example.com",
-            subject="Batch Email",
-            body="<p>Hello!</p>",
-            idempotency_key=f"batch-{recipient}"
-        )
-        futures.append(future)
+    messages = [
+        {
+            "recipient": recipient,
+            "sender": "noreply@example.com",
+            "subject": "Batch Email",
+            "body": "<p>Hello!</p>",
+            "idempotency_key": f"batch-{recipient}",
+        }
+        for recipient in recipients
+    ]
 
-    print(f"Queued {len(futures)} emails, waiting for completion...")
+    # All messages go out in a single API request
+    future = sdk.send_bulk_async(messages)
 
-    # Wait for all to complete
-    for i, future in enumerate(futures):
-        try:
-            result = future.result(timeout=30)
+    print(f"Queued {len(messages)} emails, waiting for completion...")
+
+    try:
+        results = future.result(timeout=30)
+        for i, result in enumerate(results):
             print(f"Email {i+1} sent: {result}")
-        except Exception as e:
-            print(f"Email {i+1} failed: {e}")
+    except Exception as e:
+        print(f"Batch failed: {e}")
 
 
 # Example 5: Check status without blocking
@@ -148,16 +150,15 @@ def cleanup_example():
     print("All emails sent, executor shutdown")
 
 
-# Example 7: Context manager style (if needed)
+# Example 7: Context manager style
 def context_manager_style():
     """Using SDK in a controlled scope"""
 
-    sdk_instance = FmailerSdk(
+    # shutdown(wait=True) is called when the block exits
+    with FmailerSdk(
         username="your-domain@example.com",
         password="your-token"
-    )
-
-    try:
+    ) as sdk_instance:
         # Send emails
         sdk_instance.send_simple_async(
             recipient="user@example.com",
@@ -165,9 +166,6 @@ def context_manager_style():
             subject="Test",
             body="<p>Test</p>",
         )
-    finally:
-        # Ensure cleanup
-        sdk_instance.shutdown(wait=True)
 
 
 if __name__ == "__main__":
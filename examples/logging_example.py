@@ -3,25 +3,31 @@ Example demonstrating FmailerSDK logging capabilities.
 
 This example shows how to configure different log levels and what information
 is logged at each level.
+
+The SDK logs through the "fmailersdk.sdk" logger and does not attach handlers,
+so output depends on the application's logging configuration.
 """
 
 import logging
 from fmailersdk.sdk import FmailerSdk
 
 def example_info_logging():
-    """Example with INFO level logging (default)"""
-    print("\n=== Example 1: INFO Level Logging (default) ===\n")
+    """Example with INFO level logging"""
+    print("\n=== Example 1: INFO Level Logging ===\n")
 
+    # log_level defaults to None, which leaves the level to the application.
+    # Per-send success lines are logged at DEBUG unless log_success=True.
     sdk = FmailerSdk(
         username="test@example.com",
         password="test-token",
-        log_level=logging.INFO
+        log_level=logging.INFO,
+        log_success=True
     )
 
     print("INFO level shows:")
-    print("- SDK initialization")
+    print("- SDK initialization and shutdown")
     print("- Executor creation")
-    print("- Successful email sends")
+    print("- Successful email sends (only with log_success=True)")
     print("- Error messages\n")
 
     # Note: This example uses fake credentials, so it would fail in real usage
@@ -42,6 +48,7 @@ def example_debug_logging():
 
     print("DEBUG level shows:")
     print("- All INFO level logs")
+    print("- Successful email sends, even without log_success=True")
     print("- Full request details (URL, parameters)")
     print("- Sanitized payload (auth credentials hidden)")
     print("- Response status codes and body")
@@ -1,7 +1,7 @@
 """FmailerSDK - Python SDK for Fmailer email service API."""
 
-from .sdk import FmailerSdk
+from .sdk import FmailerSdk, AsyncFmailerSdk
 from .exceptions import FmailerSdkException
 
 __version__ = "1.0.0"
-__all__ = ["FmailerSdk", "FmailerSdkException"]
+__all__ = ["FmailerSdk", "AsyncFmailerSdk", "FmailerSdkException"]
@@ -1,9 +1,11 @@
 class FmailerSdkException(Exception):
     msg = "Unhandled exception"
+    status_code = None
 
-    def __init__(self, msg: str, *args):
+    def __init__(self, msg: str, *args, status_code: int | None = None):
         super().__init__(*args)
         self.msg = msg
+        self.status_code = status_code
 
     def __str__(self):
         return f"FmailerSdkException: {self.msg}"
@@ -1,126 +1,316 @@
+import asyncio
+import dataclasses
+import datetime
+import enum
+import gzip
+import json
 import logging
-from concurrent.futures import ThreadPoolExecutor, Future
-from typing import Callable
+import math
+import os
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future, wait as wait_futures
+from typing import Any, Callable, Coroutine
 
 import requests
 from requests import exceptions
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .exceptions import FmailerSdkException
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - optional dependency
+    httpx = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    _HTTP2 = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2 = False
+
 
 logger = logging.getLogger(__name__)
 
+# Set once as session/client defaults; per-request headers only carry what varies
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_GZIP_HEADERS = {"Content-Encoding": "gzip"}
+
+# Marks the shared executor's worker threads, where submissions must never wait for a slot
+_worker_state = threading.local()
+
+
+def _finite(obj):
+    """Replace NaN and infinities with None, as orjson serializes them as null"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+def _json_default(obj):
+    """Serialize the types orjson supports natively but json.dumps does not"""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return _finite({field.name: getattr(obj, field.name) for field in dataclasses.fields(obj)})
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON with the same values orjson.dumps produces"""
+    try:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, allow_nan=False, default=_json_default).encode()
+    except ValueError:
+        # NaN and infinities are not valid JSON; only rewrite the payload when one is present
+        return json.dumps(_finite(obj), separators=(",", ":"), ensure_ascii=False, allow_nan=False, default=_json_default).encode()
+
+
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        """Serialize with orjson, which encodes request bodies several times faster than the stdlib"""
+        try:
+            # OPT_NON_STR_KEYS keeps int keys in params working like json.dumps does
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # Integers beyond 64 bits are valid JSON; unsupported types raise TypeError here too
+            return _json_dumps(obj)
+else:
+    _dumps = _json_dumps
+
 
-class FmailerSdk:
+def _decode(content: bytes) -> str:
+    """Decode a response body as UTF-8 without charset detection"""
+    return content.decode("utf-8", errors="replace")
+
+
+def _sanitized_dumps(payload: dict) -> str:
+    """Serialize a request payload for logging with a masked auth object"""
+    return '{"auth":"***",' + _dumps(payload).decode()[1:]
+
+
+class _FmailerSdkBase:
+    """Configuration and request encoding shared by FmailerSdk and AsyncFmailerSdk"""
     SERVER_URL = "https://api.fmailer.ru"
     auth = {}
     fail_silently = False
     debug = False
-    _executor = None
     _max_workers = 5
     _logger = None
+    _success_log_level = logging.DEBUG
 
-    @property
-    def api_url(self):
-        return f"{self.SERVER_URL}/external/"
+    def __init__(self, username: str, password: str, fail_silently=False, max_workers: int | None = None, log_level: int | None = None, log_success=False):
+        self.auth = {"username": username, "password": password}
+        # Auth never changes, so it is serialized once and spliced into every request body
+        self._auth_json = _dumps(self.auth)
+        self._url_simple = f"{self.SERVER_URL}/external/send_email_simple/"
+        self._url_tpl = f"{self.SERVER_URL}/external/send_email_tpl/"
+        self._url_bulk = f"{self.SERVER_URL}/external/send_email_simple_bulk/"
+        self.fail_silently = fail_silently
+        self._max_workers = max_workers if max_workers is not None else min(32, (os.cpu_count() or 1) * 5)
 
-    @property
-    def executor(self) -> ThreadPoolExecutor:
-        """Lazy initialization of thread pool executor"""
-        if self._executor is None:
-            self._logger.info(f"Initializing ThreadPoolExecutor with {self._max_workers} workers")
-            self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
-        return self._executor
+        # All instances share the module logger; handlers are configured by the application
+        self._logger = logger
+        self._success_log_level = logging.INFO if log_success else logging.DEBUG
+        if log_level is not None:
+            # Process-wide: the logger is shared, so this applies to every SDK instance
+            self._logger.setLevel(log_level)
+
+    def _encode(self, payload: dict) -> bytes:
+        """Encode a request body, prepending the pre-serialized auth object"""
+        return b'{"auth":' + self._auth_json + b"," + _dumps(payload)[1:]
 
-    def __init__(self, username: str, password: str, fail_silently=False, max_workers=5, log_level=logging.INFO):
+    def _raise_api_error(self, status_code: int, content: bytes):
+        """Raise FmailerSdkException for a non-2xx response, decoding its body once"""
+        text = _decode(content)
+        self._logger.error(f"API error - status: {status_code}, response: {text}")
+        raise FmailerSdkException(text, status_code=status_code)
+
+
+class FmailerSdk(_FmailerSdkBase):
+    _executor = None
+    _pool = None
+    # Reentrant: a finalizer may release a reference while this thread holds the lock
+    _pool_lock = threading.RLock()
+    _pool_refs = 0
+    _pool_ref = None
+    _session = None
+    _inflight = None
+    _futures = None
+    _futures_lock = None
+    _dedupe_window = None
+    _sent_keys = None
+    _sent_keys_lock = None
+    _sent_keys_maxsize = 10_000
+    _gzip_threshold = None
+    _timeout = (3.05, 10.0)
+
+    # The pool state is always read and written on FmailerSdk itself, so subclasses
+    # (e.g. with an overridden SERVER_URL) share the same pool and reference count
+    @staticmethod
+    def _acquire_shared_executor(max_workers: int) -> ThreadPoolExecutor:
+        """Return the thread pool shared by all SDK instances, growing it if max_workers exceeds its size"""
+        message = None
+        with FmailerSdk._pool_lock:
+            # Counted before anything is allocated: an allocation can run the GC, and the finalizer
+            # of a collected instance must not see the count drop to zero and shut the pool down
+            FmailerSdk._pool_refs += 1
+            pool = FmailerSdk._pool
+            if pool is None:
+                pool = FmailerSdk._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fmailer")
+                message = f"Initializing shared ThreadPoolExecutor with {max_workers} workers"
+            elif pool._max_workers < max_workers:
+                # Worker threads are spawned on demand up to _max_workers, so the pool grows in place
+                pool._max_workers = max_workers
+                message = f"Growing shared ThreadPoolExecutor to {max_workers} workers"
+        # Logged outside the lock, since handlers run arbitrary code
+        if message is not None:
+            logger.info(message)
+        return pool
+
+    @staticmethod
+    def _release_shared_executor(wait: bool):
+        """Drop a reference to the shared thread pool, shutting it down with the last SDK instance"""
+        with FmailerSdk._pool_lock:
+            FmailerSdk._pool_refs -= 1
+            if FmailerSdk._pool_refs > 0 or FmailerSdk._pool is None:
+                return
+            pool, FmailerSdk._pool = FmailerSdk._pool, None
+        logger.info("Shutting down shared ThreadPoolExecutor")
+        pool.shutdown(wait=wait)
+
+    def __init__(self, username: str, password: str, fail_silently=False, max_workers: int | None = None, log_level: int | None = None, log_success=False,
+                 dedupe_window: float | None = None, gzip_threshold: int | None = None,
+                 retries: int = 3, backoff_factor: float = 0.5, connect_timeout: float = 3.05, read_timeout: float = 10.0):
         """
         Initialize FmailerSdk.
 
         Args:
             username: API username
             password: API password
-            fail_silently: If True, suppress exceptions and return False on errors
-            max_workers: Number of worker threads for async operations
-            log_level: Logging level (e.g., logging.DEBUG, logging.INFO, logging.WARNING)
-                      Use logging.DEBUG to see detailed request/response logs
+            fail_silently: If True, suppress network exceptions and return False instead
+            max_workers: Number of worker threads for async operations. Defaults to
+                         min(32, cpu_count * 5): workers spend their time waiting on the network
+            log_level: Level for the "fmailersdk.sdk" logger (e.g., logging.DEBUG, logging.INFO).
+                      The logger is shared, so this is a process-wide setting that also
+                      applies to every other SDK instance. None (default) leaves it to the
+                      application's logging configuration. Use logging.DEBUG to see
+                      detailed request/response logs
+            log_success: If True, log every successful send at INFO level (DEBUG otherwise)
+            dedupe_window: Seconds to remember idempotency keys of successful sends; a repeated
+                           key within the window returns True without calling the API.
+                           None (default) disables client-side deduplication
+            gzip_threshold: Gzip send() request bodies larger than this many bytes (e.g. 1024).
+                            None (default) disables compression; enable it only if the API
+                            accepts Content-Encoding: gzip request bodies
+            retries: Retries for connection errors and 503 responses (0 disables). A 502 or 504
+                     from a gateway may mean the API already accepted the email, so those are
+                     not retried; pass an idempotency_key to make resending them yourself safe
+            backoff_factor: Exponential backoff between retries in seconds; Retry-After is honoured
+            connect_timeout: Seconds to wait for a connection to the API
+            read_timeout: Seconds to wait for the server to send response data. This applies per
+                          read rather than as a total deadline; read timeouts are not retried,
+                          but connection and 503 retries with backoff add to a send's duration
         """
-        self.auth = {"username": username, "password": password}
-        self.fail_silently = fail_silently
-        self._max_workers = max_workers
-
-        # Configure logger for this instance
-        self._logger = logging.getLogger(f"{__name__}.{id(self)}")
-        self._logger.setLevel(log_level)
-
-        # Add handler if none exists (avoid duplicate handlers)
-        if not self._logger.handlers:
-            handler = logging.StreamHandler()
-            handler.setLevel(log_level)
-            formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            self._logger.addHandler(handler)
-
-        self._logger.info(f"FmailerSdk initialized with username={username}, max_workers={max_workers}, log_level={logging.getLevelName(log_level)}")
-
-    def send_simple(
-        self,
-        recipient: str,
-        sender: str,
-        subject: str,
-        body: str,
-        idempotency_key: str = None,
-    ) -> bool:
+        super().__init__(username, password, fail_silently, max_workers, log_level, log_success)
+        self._timeout = (connect_timeout, read_timeout)
+        # Backpressure for send_*_async: producers block once this many tasks are pending
+        self._inflight = threading.BoundedSemaphore(self._max_workers * 4)
+        # Futures submitted by this instance, so shutdown() only drains its own work
+        self._futures = set()
+        self._futures_lock = threading.Lock()
+        # Worker threads are only spawned on the first submit, so this is cheap
+        self._acquire_executor()
+        # Idempotency key -> expiry time, oldest first
+        self._dedupe_window = dedupe_window
+        self._sent_keys = OrderedDict()
+        self._sent_keys_lock = threading.Lock()
+        self._gzip_threshold = gzip_threshold
+
+        # Shared connection pool so keep-alive connections are reused across sends
+        self._session = requests.Session()
+        self._session.headers.update(_JSON_HEADERS)
+        adapter = HTTPAdapter(
+            pool_connections=self._max_workers,
+            pool_maxsize=self._max_workers,
+            # The shared executor may run more of this instance's tasks than pool_maxsize;
+            # wait for a pooled connection rather than opening one that is discarded afterwards
+            pool_block=True,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=backoff_factor,
+                # Only 503 says the request was not processed; after a gateway 502/504 the
+                # API may already have accepted the email, and a resend would duplicate it
+                status_forcelist=[503],
+                # POST is not retried on status codes by default
+                allowed_methods=["POST"],
+                # A read error means the request may have been delivered, so it is never resent
+                read=False,
+                respect_retry_after_header=True,
+                # Return the last error response so FmailerSdkException carries its status_code
+                raise_on_status=False,
+            ),
+        )
+        # Also mounted on http:// so an overridden SERVER_URL (e.g. a local proxy) gets the same pool
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._logger.info(f"FmailerSdk initialized with username={username}, max_workers={self._max_workers}, log_level={logging.getLevelName(self._logger.getEffectiveLevel())}")
+
+    def _is_duplicate(self, idempotency_key: str | None) -> bool:
+        """Check whether an idempotency key was sent successfully within dedupe_window"""
+        if self._dedupe_window is None or not idempotency_key:
+            return False
+        with self._sent_keys_lock:
+            expires_at = self._sent_keys.get(idempotency_key)
+            return expires_at is not None and expires_at > time.monotonic()
+
+    def _remember_sent(self, idempotency_key: str | None):
+        if self._dedupe_window is None or not idempotency_key:
+            return
+        with self._sent_keys_lock:
+            self._sent_keys[idempotency_key] = time.monotonic() + self._dedupe_window
+            self._sent_keys.move_to_end(idempotency_key)
+            while len(self._sent_keys) > self._sent_keys_maxsize:
+                self._sent_keys.popitem(last=False)
+
+    def _build_simple(self, recipient, sender, subject, body, idempotency_key) -> tuple[str, bytes, dict | None]:
+        """Encode a simple email request as (url, body, headers)"""
         payload = {
-            "auth": self.auth,
             "recipient": recipient,
             "sender": sender,
             "subject": subject,
             "body": body,
             "idempotency_key": idempotency_key,
         }
-        try:
-            path = f"{self.api_url}send_email_simple/"
-
-            # Debug log for request
+        if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug(
-                f"Sending simple email - URL: {path}, "
+                f"Sending simple email - URL: {self._url_simple}, "
                 f"recipient: {recipient}, sender: {sender}, subject: {subject}, "
                 f"idempotency_key: {idempotency_key}"
             )
-            self._logger.debug(f"Request payload: {json.dumps({**payload, 'auth': '***'})}")
-
-            res = requests.post(path, json=payload)
-
-            # Debug log for response
-            try:
-                response_text = res.text[:200] + "..." if len(res.text) > 200 else res.text
-            except (TypeError, AttributeError):
-                response_text = str(res.text)
-            self._logger.debug(f"Response received - status_code: {res.status_code}, response: {response_text}")
-
-            if not res.ok:
-                self._logger.error(f"API error - status: {res.status_code}, response: {res.text}")
-                raise FmailerSdkException(res.text)
-
-            self._logger.info(f"Simple email sent successfully to {recipient}")
-        except exceptions.RequestException as exc:
-            self._logger.error(f"Request exception while sending email: {exc}")
-            if not self.fail_silently:
-                raise FmailerSdkException("Fmailer API error") from exc
-        return True
+            self._logger.debug(f"Request payload: {_sanitized_dumps(payload)}")
+        return self._url_simple, self._encode(payload), None
 
-    def send(
-        self,
-        tpl: str,
-        recipient: str,
-        sender: str,
-        lang: str | None = None,
-        params: dict | None = None,
-        idempotency_key: str | None = None,
-    ):
+    def _build_tpl(self, tpl, recipient, sender, lang, params, idempotency_key) -> tuple[str, bytes, dict | None]:
+        """Encode a templated email request as (url, body, headers), gzipping large bodies if enabled"""
         payload = {
-            "auth": self.auth,
             "tpl": tpl,
             "recipient": recipient,
             "sender": sender,
@@ -128,37 +318,113 @@ class FmailerSdk:
             "params": params,
             "idempotency_key": idempotency_key,
         }
-        try:
-            path = f"{self.api_url}send_email_tpl/"
-
-            # Debug log for request
+        if self._logger.isEnabledFor(logging.DEBUG):
             self._logger.debug(
-                f"Sending templated email - URL: {path}, "
+                f"Sending templated email - URL: {self._url_tpl}, "
                 f"template: {tpl}, recipient: {recipient}, sender: {sender}, "
                 f"lang: {lang}, idempotency_key: {idempotency_key}"
             )
-            self._logger.debug(f"Request payload: {json.dumps({**payload, 'auth': '***'})}")
+            self._logger.debug(f"Request payload: {_sanitized_dumps(payload)}")
+
+        data = self._encode(payload)
+        if self._gzip_threshold is not None and len(data) > self._gzip_threshold:
+            # Large template params compress well; level 1 keeps the CPU cost in microseconds
+            return self._url_tpl, gzip.compress(data, compresslevel=1), _GZIP_HEADERS
+        return self._url_tpl, data, None
+
+    def _build_bulk(self, messages) -> tuple[str, bytes, dict | None]:
+        """Encode a bulk request as (url, body, headers)"""
+        self._logger.debug(f"Sending bulk email - URL: {self._url_bulk}, messages: {len(messages)}")
+        return self._url_bulk, self._encode({"messages": messages}), None
+
+    def _execute_request(self, url: str, data: bytes, headers: dict | None) -> bool:
+        """
+        POST a request built by one of the _build_* methods.
 
-            res = requests.post(path, json=payload)
+        Returns False if a network error was suppressed by fail_silently.
+        """
+        try:
+            res = self._session.post(url, data=data, headers=headers, timeout=self._timeout)
 
             # Debug log for response
-            try:
-                response_text = res.text[:200] + "..." if len(res.text) > 200 else res.text
-            except (TypeError, AttributeError):
-                response_text = str(res.text)
-            self._logger.debug(f"Response received - status_code: {res.status_code}, response: {response_text}")
+            if self._logger.isEnabledFor(logging.DEBUG):
+                response_text = _decode(res.content[:200]) + ("..." if len(res.content) > 200 else "")
+                self._logger.debug(f"Response received - status_code: {res.status_code}, response: {response_text}")
 
             if not res.ok:
-                self._logger.error(f"API error - status: {res.status_code}, response: {res.text}")
-                raise FmailerSdkException(str(res.text))
-
-            self._logger.info(f"Templated email sent successfully to {recipient} using template '{tpl}'")
+                self._raise_api_error(res.status_code, res.content)
+        except exceptions.Timeout as exc:
+            self._logger.error(f"Timeout while sending email: {exc}")
+            if not self.fail_silently:
+                raise FmailerSdkException("Fmailer API timeout") from exc
+            return False
         except exceptions.RequestException as exc:
             self._logger.error(f"Request exception while sending email: {exc}")
             if not self.fail_silently:
                 raise FmailerSdkException("Fmailer API error") from exc
+            return False
         return True
 
+    def _deliver(self, request: tuple, recipient: str, idempotency_key: str | None, kind: str) -> bool:
+        """
+        Execute a built single-email request unless its idempotency_key was already sent.
+
+        Returns False if a network error was suppressed by fail_silently.
+        """
+        if self._is_duplicate(idempotency_key):
+            self._logger.debug(f"Skipping {kind} email to {recipient}, idempotency_key {idempotency_key} already sent")
+            return True
+        if self._execute_request(*request):
+            self._remember_sent(idempotency_key)
+            if self._logger.isEnabledFor(self._success_log_level):
+                self._logger.log(self._success_log_level, f"{kind.capitalize()} email sent successfully to {recipient}")
+            return True
+        return False
+
+    def _deliver_bulk(self, request: tuple, count: int) -> list[bool]:
+        sent = self._execute_request(*request)
+        if sent and self._logger.isEnabledFor(self._success_log_level):
+            self._logger.log(self._success_log_level, f"Bulk email sent successfully to {count} recipients")
+        return [sent] * count
+
+    def send_simple(
+        self,
+        recipient: str,
+        sender: str,
+        subject: str,
+        body: str,
+        idempotency_key: str = None,
+    ) -> bool:
+        request = self._build_simple(recipient, sender, subject, body, idempotency_key)
+        return self._deliver(request, recipient, idempotency_key, "simple")
+
+    def send(
+        self,
+        tpl: str,
+        recipient: str,
+        sender: str,
+        lang: str | None = None,
+        params: dict | None = None,
+        idempotency_key: str | None = None,
+    ):
+        request = self._build_tpl(tpl, recipient, sender, lang, params, idempotency_key)
+        return self._deliver(request, recipient, idempotency_key, "templated")
+
+    def send_bulk(self, messages: list[dict]) -> list[bool]:
+        """
+        Send many simple emails in a single API request.
+
+        Args:
+            messages: List of dicts with the send_simple() fields
+                      (recipient, sender, subject, body, optional idempotency_key)
+
+        Returns:
+            List with one entry per message, all equal: True if the API accepted the
+            request, False if a network error was suppressed by fail_silently. The
+            response is not parsed per message, and dedupe_window does not apply
+        """
+        return self._deliver_bulk(self._build_bulk(messages), len(messages))
+
     def send_simple_async(
         self,
         recipient: str,
@@ -167,6 +433,7 @@ class FmailerSdk:
         body: str,
         idempotency_key: str = None,
         callback: Callable[[bool, Exception | None], None] | None = None,
+        block: bool = True,
     ) -> Future:
         """
         Send a simple email asynchronously in a background thread.
@@ -178,6 +445,8 @@ class FmailerSdk:
             body: Email body (HTML)
             idempotency_key: Optional unique key to prevent duplicate sends
             callback: Optional callback function called with (result, exception)
+            block: If False, raise FmailerSdkException instead of waiting when
+                   max_workers * 4 sends are already pending
 
         Returns:
             Future object that can be used to wait for the result or check status
@@ -200,30 +469,9 @@ class FmailerSdk:
             result = future.result()  # Blocks until complete
         """
         self._logger.debug(f"Submitting async simple email task for {recipient}")
-
-        def task():
-            try:
-                self._logger.debug(f"Async task started for simple email to {recipient}")
-                result = self.send_simple(
-                    recipient=recipient,
-                    sender=sender,
-                    subject=subject,
-                    body=body,
-                    idempotency_key=idempotency_key,
-                )
-                if callback:
-                    self._logger.debug(f"Calling callback for successful async email to {recipient}")
-                    callback(result, None)
-                self._logger.debug(f"Async task completed successfully for {recipient}")
-                return result
-            except Exception as e:
-                self._logger.error(f"Async task failed for {recipient}: {e}")
-                if callback:
-                    self._logger.debug(f"Calling callback with error for {recipient}")
-                    callback(False, e)
-                raise
-
-        return self.executor.submit(task)
+        # Encoding happens on the caller thread; the worker only posts and parses the response
+        request = self._build_simple(recipient, sender, subject, body, idempotency_key)
+        return self._submit(self._task_send, request, recipient, idempotency_key, "simple", callback, block=block)
 
     def send_async(
         self,
@@ -234,6 +482,7 @@ class FmailerSdk:
         params: dict | None = None,
         idempotency_key: str | None = None,
         callback: Callable[[bool, Exception | None], None] | None = None,
+        block: bool = True,
     ) -> Future:
         """
         Send a templated email asynchronously in a background thread.
@@ -246,6 +495,8 @@ class FmailerSdk:
             params: Template parameters
             idempotency_key: Optional unique key to prevent duplicate sends
             callback: Optional callback function called with (result, exception)
+            block: If False, raise FmailerSdkException instead of waiting when
+                   max_workers * 4 sends are already pending
 
         Returns:
             Future object that can be used to wait for the result or check status
@@ -268,47 +519,348 @@ class FmailerSdk:
             result = future.result()  # Blocks until complete
         """
         self._logger.debug(f"Submitting async templated email task for {recipient} with template '{tpl}'")
+        request = self._build_tpl(tpl, recipient, sender, lang, params, idempotency_key)
+        return self._submit(self._task_send, request, recipient, idempotency_key, "templated", callback, block=block)
+
+    def send_bulk_async(
+        self,
+        messages: list[dict],
+        callback: Callable[[list[bool], Exception | None], None] | None = None,
+        block: bool = True,
+    ) -> Future:
+        """
+        Send many simple emails in a single API request in a background thread.
+
+        Args:
+            messages: List of dicts with the send_simple() fields
+            callback: Optional callback function called with (results, exception)
+            block: If False, raise FmailerSdkException instead of waiting when the queue is full
+
+        Returns:
+            Future resolving to the list returned by send_bulk()
+        """
+        self._logger.debug(f"Submitting async bulk email task for {len(messages)} messages")
+        return self._submit(self._task_bulk, self._build_bulk(messages), len(messages), callback, block=block)
+
+    async def send_simple_asyncio(
+        self,
+        recipient: str,
+        sender: str,
+        subject: str,
+        body: str,
+        idempotency_key: str = None,
+        callback: Callable[[bool, Exception | None], None] | None = None,
+    ) -> bool:
+        """
+        Send a simple email from asyncio code on the SDK's thread pool.
+
+        Unlike AsyncFmailerSdk, this does not require httpx: the request is posted
+        from the shared SDK executor, so the application does not need a thread
+        pool of its own.
+
+        Example:
+            result = await sdk.send_simple_asyncio(recipient="user@example.com", ...)
+        """
+        self._logger.debug(f"Submitting asyncio simple email task for {recipient}")
+        request = self._build_simple(recipient, sender, subject, body, idempotency_key)
+        return await asyncio.wrap_future(self._track(self._ensure_executor().submit(
+            self._task_send, request, recipient, idempotency_key, "simple", callback
+        )))
 
-        def task():
+    async def send_asyncio(
+        self,
+        tpl: str,
+        recipient: str,
+        sender: str,
+        lang: str | None = None,
+        params: dict | None = None,
+        idempotency_key: str | None = None,
+        callback: Callable[[bool, Exception | None], None] | None = None,
+    ) -> bool:
+        """
+        Send a templated email from asyncio code on the SDK's thread pool.
+
+        Unlike AsyncFmailerSdk, this does not require httpx: the request is posted
+        from the shared SDK executor.
+
+        Example:
+            result = await sdk.send_asyncio(tpl="welcome", recipient="user@example.com", ...)
+        """
+        self._logger.debug(f"Submitting asyncio templated email task for {recipient} with template '{tpl}'")
+        request = self._build_tpl(tpl, recipient, sender, lang, params, idempotency_key)
+        return await asyncio.wrap_future(self._track(self._ensure_executor().submit(
+            self._task_send, request, recipient, idempotency_key, "templated", callback
+        )))
+
+    def _submit(self, fn, *args, block=True) -> Future:
+        """Submit a task to the executor, blocking while max_workers * 4 tasks are pending"""
+        # A callback queueing a follow-up send runs on a worker thread; waiting there could
+        # deadlock, since slots are freed by tasks that need a worker, so it overcommits instead
+        on_worker = getattr(_worker_state, "active", False)
+        holds_slot = self._inflight.acquire(blocking=block and not on_worker)
+        if not holds_slot and not (block and on_worker):
+            self._logger.warning("Async send rejected, too many pending tasks")
+            raise FmailerSdkException("Fmailer send queue is full")
+        try:
+            future = self._ensure_executor().submit(fn, *args, holds_slot=holds_slot)
+        except BaseException:
+            if holds_slot:
+                self._inflight.release()
+            raise
+        with self._futures_lock:
+            self._futures.add(future)
+        # One done callback for all bookkeeping; user callbacks run inline in the task itself
+        future.add_done_callback(self._finish_submitted if holds_slot else self._untrack)
+        return future
+
+    def _finish_submitted(self, future: Future):
+        """Done callback for _submit(): forget the future, freeing the slot of a task that never ran"""
+        with self._futures_lock:
+            self._futures.discard(future)
+        # A task that ran freed its slot itself, before invoking the user callback
+        if future.cancelled():
+            self._inflight.release()
+
+    def _end_task(self, holds_slot: bool):
+        """Free the backpressure slot of a task submitted by _submit()"""
+        if holds_slot:
+            self._inflight.release()
+
+    def _track(self, future: Future) -> Future:
+        """Remember a pending future of this instance until it completes"""
+        with self._futures_lock:
+            self._futures.add(future)
+        future.add_done_callback(self._untrack)
+        return future
+
+    def _untrack(self, future: Future):
+        with self._futures_lock:
+            self._futures.discard(future)
+
+    def _task_send(self, request, recipient, idempotency_key, kind, callback, holds_slot=False):
+        """Executor task behind send_simple_async() and send_async()"""
+        _worker_state.active = True
+        try:
+            self._logger.debug(f"Async task started for {kind} email to {recipient}")
+            try:
+                result = self._deliver(request, recipient, idempotency_key, kind)
+            finally:
+                # Freed before the callback runs, so it can queue a follow-up send
+                self._end_task(holds_slot)
+            if callback:
+                self._logger.debug(f"Calling callback for successful async email to {recipient}")
+                callback(result, None)
+            self._logger.debug(f"Async task completed successfully for {recipient}")
+            return result
+        except Exception as e:
+            self._logger.error(f"Async task failed for {recipient}: {e}")
+            if callback:
+                self._logger.debug(f"Calling callback with error for {recipient}")
+                callback(False, e)
+            raise
+
+    def _task_bulk(self, request, count, callback, holds_slot=False):
+        """Executor task behind send_bulk_async()"""
+        _worker_state.active = True
+        try:
             try:
-                self._logger.debug(f"Async task started for templated email to {recipient} (template: {tpl})")
-                result = self.send(
-                    tpl=tpl,
-                    recipient=recipient,
-                    sender=sender,
-                    lang=lang,
-                    params=params,
-                    idempotency_key=idempotency_key,
-                )
-                if callback:
-                    self._logger.debug(f"Calling callback for successful async email to {recipient}")
-                    callback(result, None)
-                self._logger.debug(f"Async task completed successfully for {recipient}")
-                return result
-            except Exception as e:
-                self._logger.error(f"Async task failed for {recipient}: {e}")
-                if callback:
-                    self._logger.debug(f"Calling callback with error for {recipient}")
-                    callback(False, e)
-                raise
-
-        return self.executor.submit(task)
-
-    def shutdown(self, wait=True):
+                result = self._deliver_bulk(request, count)
+            finally:
+                self._end_task(holds_slot)
+            if callback:
+                callback(result, None)
+            return result
+        except Exception as e:
+            self._logger.error(f"Async bulk task failed: {e}")
+            if callback:
+                callback([False] * count, e)
+            raise
+
+    def _acquire_executor(self):
+        """Take a reference to the shared pool; it is released by shutdown() or when the instance is collected"""
+        self._executor = self._acquire_shared_executor(self._max_workers)
+        # The finalizer must not reference self, or the instance would never be collected
+        self._pool_ref = weakref.finalize(self, FmailerSdk._release_shared_executor, False)
+        # concurrent.futures joins its workers at exit on its own
+        self._pool_ref.atexit = False
+
+    def _ensure_executor(self) -> ThreadPoolExecutor:
+        """Return the shared pool, re-acquiring it if shutdown() released this instance's reference"""
+        if not self._pool_ref.alive:
+            with self._futures_lock:
+                if not self._pool_ref.alive:
+                    self._logger.debug("Re-acquiring shared ThreadPoolExecutor after shutdown")
+                    self._acquire_executor()
+        return self._executor
+
+    def shutdown(self, wait=True, cancel_futures=False):
         """
-        Shutdown the thread pool executor.
+        Wait for pending async sends and close pooled HTTP connections.
+
+        The executor is shared by all SDK instances, so only the tasks submitted
+        by this instance are waited for or cancelled. The pool itself is shut down
+        once the last instance using it has been shut down. The instance stays
+        usable: a later async send takes a new reference to the pool.
 
         Args:
-            wait: If True, wait for all pending tasks to complete
+            wait: If True, wait for all pending tasks of this instance to complete
+            cancel_futures: If True, cancel tasks of this instance that have not started
+                            yet; their callbacks are not called. Requests already in
+                            flight run until they complete or time out, including retries
         """
-        if self._executor is not None:
-            self._logger.info(f"Shutting down ThreadPoolExecutor (wait={wait})")
-            self._executor.shutdown(wait=wait)
-            self._executor = None
-            self._logger.debug("ThreadPoolExecutor shutdown complete")
-
-    def __del__(self):
-        """Cleanup executor on garbage collection"""
-        if self._logger:
-            self._logger.debug("FmailerSdk instance being destroyed, cleaning up executor")
-        self.shutdown(wait=False)
+        self._logger.info(f"Shutting down FmailerSdk (wait={wait}, cancel_futures={cancel_futures})")
+        if cancel_futures:
+            with self._futures_lock:
+                pending = list(self._futures)
+            cancelled = sum(future.cancel() for future in pending)
+            self._logger.debug(f"Cancelled {cancelled} queued async tasks")
+        if wait:
+            with self._futures_lock:
+                pending = list(self._futures)
+            wait_futures(pending)
+            self._logger.debug("Pending async tasks completed")
+        if self._session is not None:
+            self._session.close()
+        # detach() disarms the finalizer and returns None if the reference was already released
+        if self._pool_ref.detach() is not None:
+            self._release_shared_executor(wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.shutdown(wait=True)
+
+
+class AsyncFmailerSdk(_FmailerSdkBase):
+    """
+    Native asyncio client built on httpx.AsyncClient.
+
+    Sends run on the caller's event loop instead of occupying a worker thread per
+    request. Requires httpx (pip install fmailersdk[async]). Use FmailerSdk for
+    synchronous and thread-based sending.
+    """
+    _client = None
+
+    def __init__(self, username: str, password: str, fail_silently=False, max_connections: int | None = None, log_level: int | None = None, log_success=False,
+                 connect_timeout: float = 3.05, read_timeout: float = 10.0):
+        """
+        Initialize AsyncFmailerSdk.
+
+        Args:
+            username: API username
+            password: API password
+            fail_silently: If True, suppress network exceptions and return False instead
+            max_connections: Maximum number of HTTP connections. Defaults to min(32, cpu_count * 5)
+            log_level: Process-wide level for the shared "fmailersdk.sdk" logger; None leaves it to the application
+            log_success: If True, log every successful send at INFO level (DEBUG otherwise)
+            connect_timeout: Seconds to wait for a connection to the API
+            read_timeout: Seconds to wait for response data
+        """
+        if httpx is None:
+            raise ImportError("httpx is required for AsyncFmailerSdk, install fmailersdk[async]")
+        super().__init__(username, password, fail_silently, max_connections, log_level, log_success)
+
+        # One multiplexed HTTP/2 connection serves concurrent sends when h2 is installed
+        self._client = httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(
+                max_connections=self._max_workers,
+                max_keepalive_connections=self._max_workers,
+            ),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            headers=_JSON_HEADERS,
+            event_hooks={"response": [self._check_response]},
+        )
+
+        self._logger.info(f"AsyncFmailerSdk initialized with username={username}, max_connections={self._max_workers}, http2={_HTTP2}")
+
+    async def _check_response(self, response: "httpx.Response"):
+        """Response event hook: log the response and raise FmailerSdkException for 4xx/5xx statuses"""
+        log_debug = self._logger.isEnabledFor(logging.DEBUG)
+        if not (log_debug or response.is_error):
+            return
+        # Hooks run before the body is read
+        await response.aread()
+        if log_debug:
+            self._logger.debug(f"Response received - status_code: {response.status_code}, response: {_decode(response.content[:200])}")
+        # Same predicate as the early return, so enabling DEBUG never changes the result
+        if response.is_error:
+            self._raise_api_error(response.status_code, response.content)
+
+    async def _post(self, url: str, payload: dict, recipient: str, kind: str) -> bool:
+        if self._logger.isEnabledFor(logging.DEBUG):
+            self._logger.debug(f"Sending {kind} email - URL: {url}, recipient: {recipient}")
+            self._logger.debug(f"Request payload: {_sanitized_dumps(payload)}")
+        try:
+            await self._client.post(url, content=self._encode(payload))
+        except httpx.TimeoutException as exc:
+            self._logger.error(f"Timeout while sending email: {exc}")
+            if not self.fail_silently:
+                raise FmailerSdkException("Fmailer API timeout") from exc
+            return False
+        except httpx.HTTPError as exc:
+            self._logger.error(f"Request exception while sending email: {exc}")
+            if not self.fail_silently:
+                raise FmailerSdkException("Fmailer API error") from exc
+            return False
+        if self._logger.isEnabledFor(self._success_log_level):
+            self._logger.log(self._success_log_level, f"{kind.capitalize()} email sent successfully to {recipient}")
+        return True
+
+    def send_simple_async(
+        self,
+        recipient: str,
+        sender: str,
+        subject: str,
+        body: str,
+        idempotency_key: str = None,
+    ) -> Coroutine[Any, Any, bool]:
+        """
+        Send a simple email. Returns a coroutine; the request is made when it is awaited.
+
+        Example:
+            result = await sdk.send_simple_async(recipient="user@example.com", ...)
+        """
+        return self._post(self._url_simple, {
+            "recipient": recipient,
+            "sender": sender,
+            "subject": subject,
+            "body": body,
+            "idempotency_key": idempotency_key,
+        }, recipient, "simple")
+
+    def send_async(
+        self,
+        tpl: str,
+        recipient: str,
+        sender: str,
+        lang: str | None = None,
+        params: dict | None = None,
+        idempotency_key: str | None = None,
+    ) -> Coroutine[Any, Any, bool]:
+        """
+        Send a templated email. Returns a coroutine; the request is made when it is awaited.
+
+        Example:
+            result = await sdk.send_async(tpl="welcome", recipient="user@example.com", ...)
+        """
+        return self._post(self._url_tpl, {
+            "tpl": tpl,
+            "recipient": recipient,
+            "sender": sender,
+            "lang": lang,
+            "params": params,
+            "idempotency_key": idempotency_key,
+        }, recipient, "templated")
+
+    async def aclose(self):
+        """Close the underlying httpx.AsyncClient"""
+        self._logger.info("Closing httpx.AsyncClient")
+        await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
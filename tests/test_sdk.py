@@ -1,35 +1,337 @@
+import datetime
+import gc
+import gzip
+import inspect
+import logging
+import threading
 import unittest
-from unittest.mock import patch, Mock, MagicMock
+import uuid
+from unittest.mock import patch, Mock, MagicMock, AsyncMock
 import time
 from concurrent.futures import TimeoutError as FuturesTimeoutError
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
+import httpx
+import orjson
 import requests
 from faker import Faker
 
 from fmailersdk.exceptions import FmailerSdkException
-from fmailersdk.sdk import FmailerSdk
+from fmailersdk.sdk import FmailerSdk, AsyncFmailerSdk, _dumps, _json_dumps
 
 faker = Faker()
 
 
+def _start_server(test: unittest.TestCase, statuses: list[int] | None = None, delay: float = 0) -> tuple[str, list[int]]:
+    """
+    Start a local keep-alive HTTP server for the duration of a test.
+
+    POSTs are answered after `delay` seconds with the given status codes in order, then 200.
+    Returns the server URL and the client port of every request received.
+    """
+    client_ports = []
+    statuses = list(statuses or [])
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            client_ports.append(self.client_address[1])
+            self.rfile.read(int(self.headers["Content-Length"]))
+            time.sleep(delay)
+            try:
+                self.send_response(statuses.pop(0) if statuses else 200)
+                self.send_header("Content-Length", "2")
+                self.end_headers()
+                self.wfile.write(b"OK")
+            except OSError:
+                # The client gave up waiting
+                pass
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    test.addCleanup(server.server_close)
+    test.addCleanup(server.shutdown)
+    return f"http://127.0.0.1:{server.server_port}", client_ports
+
+
 class FmailersdkTestUtils(unittest.TestCase):
-    @patch("requests.post")
+    def setUp(self):
+        # log_level sets the shared module logger; restore it so tests do not depend on order
+        logger = logging.getLogger("fmailersdk.sdk")
+        self.addCleanup(logger.setLevel, logger.level)
+
+    @patch("requests.Session.post")
     def test_send_simple_exception(self, mock_post):
         mock_post.side_effect = requests.exceptions.ConnectionError()
-        sdk = FmailerSdk("test", "test")
+        sdk = FmailerSdk("test", "test", retries=0)
         with self.assertRaises(FmailerSdkException) as context:
             res = sdk.send("test", faker.email(), faker.email(), "ru", {}, "")
         self.assertTrue("Fmailer" in str(context.exception))
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
+    def test_send_timeout(self, mock_post):
+        mock_post.side_effect = requests.exceptions.ReadTimeout()
+        sdk = FmailerSdk("test", "test", connect_timeout=1.5, read_timeout=4)
+        with self.assertRaises(FmailerSdkException) as context:
+            sdk.send_simple(faker.email(), faker.email(), "Test", "<p>Test</p>")
+        self.assertEqual(context.exception.msg, "Fmailer API timeout")
+        self.assertEqual(mock_post.call_args[1]['timeout'], (1.5, 4))
+
+    @patch("requests.Session.post")
+    def test_send_uses_pooled_session(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.content = b"OK"
+        sdk = FmailerSdk("test", "test", max_workers=7)
+        adapter = sdk._session.get_adapter(sdk.SERVER_URL)
+        self.assertEqual(adapter._pool_maxsize, 7)
+        self.assertIs(sdk._session.get_adapter("http://127.0.0.1/"), adapter)
+        self.assertEqual(sdk._session.headers["Content-Type"], "application/json")
+        sdk.send_simple(faker.email(), faker.email(), "Test", "<p>Test</p>")
+        sdk.send("test", faker.email(), faker.email())
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertEqual(mock_post.call_args[1]['timeout'], (3.05, 10.0))
+
+    @patch("requests.Session.post")
+    def test_send_bulk(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+        messages = [
+            {"recipient": faker.email(), "sender": faker.email(), "subject": "Test", "body": "<p>Test</p>"}
+            for _ in range(3)
+        ]
+        sdk = FmailerSdk("test", "test")
+        self.assertEqual(sdk.send_bulk(messages), [True, True, True])
+        mock_post.assert_called_once()
+        self.assertTrue(mock_post.call_args[0][0].endswith("send_email_simple_bulk/"))
+        self.assertEqual(orjson.loads(mock_post.call_args[1]['data'])['messages'], messages)
+
+    @patch("requests.Session.post")
+    def test_send_bulk_fail_silently_reports_failure(self, mock_post):
+        mock_post.side_effect = requests.exceptions.ConnectionError()
+        sdk = FmailerSdk("test", "test", fail_silently=True)
+        messages = [
+            {"recipient": faker.email(), "sender": faker.email(), "subject": "Test", "body": "<p>Test</p>"}
+            for _ in range(3)
+        ]
+        self.assertEqual(sdk.send_bulk(messages), [False] * 3)
+
+    @patch("requests.Session.post")
+    def test_send_skips_debug_serialization_above_debug(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+        sdk = FmailerSdk("test", "test", log_level=logging.INFO)
+        with patch("fmailersdk.sdk._dumps", wraps=_dumps) as mock_dumps:
+            sdk.send("test", faker.email(), faker.email(), "ru", {"name": "John"})
+        # Only the request body is serialized
+        mock_dumps.assert_called_once()
+
+    @patch("requests.Session.post")
+    def test_auth_serialized_once(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+        sdk = FmailerSdk("user", "password")
+        with patch("fmailersdk.sdk._dumps", wraps=_dumps) as mock_dumps:
+            sdk.send_simple(faker.email(), faker.email(), "Test", "<p>Test</p>")
+            sdk.send("test", faker.email(), faker.email(), "ru", {"name": "John"})
+        self.assertEqual(mock_dumps.call_count, 2)
+        self.assertTrue(all("auth" not in c[0][0] for c in mock_dumps.call_args_list))
+        body = orjson.loads(mock_post.call_args[1]['data'])
+        self.assertEqual(body['auth'], {"username": "user", "password": "password"})
+        self.assertEqual(body['params'], {"name": "John"})
+
+    @patch("requests.Session.post")
+    def test_stdlib_json_fallback_matches_orjson(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+        params = {"name": "Иван", "items": [1, 2.5, None, True], 1: "x"}
+        self.assertEqual(_json_dumps(params), _dumps(params))
+
+        # Types orjson serializes natively, and non-finite floats it writes as null
+        native = {
+            "date": datetime.date(2024, 1, 31),
+            "created": datetime.datetime(2024, 1, 31, 12, 30, 5, 123456, tzinfo=datetime.timezone.utc),
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "scores": [float("nan"), float("inf"), -float("inf"), 1.5],
+        }
+        self.assertEqual(_json_dumps(native), _dumps(native))
+        self.assertEqual(orjson.loads(_json_dumps(native))["scores"], [None, None, None, 1.5])
+
+        # Integers beyond 64 bits are valid JSON on both paths
+        self.assertEqual(_json_dumps({"big": 2 ** 70}), _dumps({"big": 2 ** 70}))
+
+        # Unsupported types raise TypeError on both paths
+        for dumps in (_json_dumps, _dumps):
+            with self.assertRaises(TypeError):
+                dumps({"value": object()})
+
+        sdk = FmailerSdk("user", "password")
+        sdk.send("test", faker.email(), faker.email(), "ru", params)
+        self.assertEqual(orjson.loads(mock_post.call_args[1]['data'])['params']["1"], "x")
+
+        with patch("fmailersdk.sdk._dumps", _json_dumps):
+            sdk = FmailerSdk("user", "password")
+            sdk.send("test", faker.email(), faker.email(), "ru", params)
+        body = orjson.loads(mock_post.call_args[1]['data'])
+        self.assertEqual(body['auth'], {"username": "user", "password": "password"})
+        self.assertEqual(body['params']["1"], "x")
+
+    @patch("os.cpu_count", return_value=4)
+    def test_default_max_workers_scales_with_cpus(self, mock_cpu_count):
+        self.assertEqual(FmailerSdk("test", "test")._max_workers, 20)
+        mock_cpu_count.return_value = 16
+        self.assertEqual(FmailerSdk("test", "test")._max_workers, 32)
+        self.assertEqual(FmailerSdk("test", "test", max_workers=3)._max_workers, 3)
+
+    def test_init_accepts_log_level(self):
+        self.assertIn("log_level", inspect.signature(FmailerSdk.__init__).parameters)
+        sdk = FmailerSdk("test", "test", log_level=logging.ERROR)
+        self.assertEqual(sdk._logger.level, logging.ERROR)
+
+    def test_instances_share_module_logger(self):
+        first = FmailerSdk("test", "test")
+        second = FmailerSdk("test", "test", log_level=logging.WARNING)
+        self.assertIs(first._logger, second._logger)
+        self.assertEqual(first._logger.name, "fmailersdk.sdk")
+        self.assertEqual(first._logger.handlers, [])
+        self.assertEqual(first._logger.level, logging.WARNING)
+
+    def test_connections_are_kept_alive(self):
+        url, client_ports = _start_server(self)
+
+        with patch.object(FmailerSdk, "SERVER_URL", url):
+            sdk = FmailerSdk("test", "test")
+        for _ in range(3):
+            sdk.send_simple(faker.email(), faker.email(), "Test", "<p>Test</p>")
+        sdk.shutdown()
+
+        self.assertEqual(len(client_ports), 3)
+        self.assertEqual(len(set(client_ports)), 1)
+
+    def test_transient_errors_are_retried(self):
+        url, client_ports = _start_server(self, statuses=[503, 200, 503, 503, 502, 504])
+
+        with patch.object(FmailerSdk, "SERVER_URL", url):
+            sdk = FmailerSdk("test", "test", retries=1, backoff_factor=0)
+        self.addCleanup(sdk.shutdown)
+        self.assertTrue(sdk.send_simple(faker.email(), faker.email(), "Test", "<p>Test</p>"))
+        with self.assertRaises(FmailerSdkException) as context:
+            sdk.send_simple(faker.email(), faker.email(), "Test", "<p>Test</p>")
+        self.assertEqual(context.exception.status_code, 503)
+        self.assertEqual(len(client_ports), 4)
+
+        # A gateway error may follow an accepted email, so it is never resent
+        for status_code in (502, 504):
+            with self.assertRaises(FmailerSdkException) as context:
+                sdk.send_simple(faker.email(), faker.email(), "Test", "<p>Test</p>")
+            self.assertEqual(context.exception.status_code, status_code)
+        self.assertEqual(len(client_ports), 6)
+
+    def test_read_timeout_is_not_retried(self):
+        url, client_ports = _start_server(self, delay=0.5)
+
+        for retries in (0, 3):
+            with patch.object(FmailerSdk, "SERVER_URL", url):
+                sdk = FmailerSdk("test", "test", retries=retries, backoff_factor=0, read_timeout=0.1)
+            self.addCleanup(sdk.shutdown)
+            with self.assertRaises(FmailerSdkException) as context:
+                sdk.send_simple(faker.email(), faker.email(), "Test", "<p>Test</p>")
+            self.assertEqual(context.exception.msg, "Fmailer API timeout")
+            self.assertIsInstance(context.exception.__cause__, requests.exceptions.ReadTimeout)
+        # The server may already have accepted the email, so it must not be sent again
+        self.assertEqual(len(client_ports), 2)
+
+    @patch("requests.Session.post")
+    def test_debug_log_masks_credentials(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.content = b"OK"
+        sdk = FmailerSdk("user", "secret-password", log_level=logging.DEBUG)
+        with self.assertLogs("fmailersdk.sdk", level=logging.DEBUG) as logs:
+            sdk.send("test", faker.email(), faker.email(), "ru", {"name": "John"})
+        self.assertNotIn("secret-password", "\n".join(logs.output))
+        self.assertTrue(any('"auth":"***"' in line for line in logs.output))
+        self.assertEqual(orjson.loads(mock_post.call_args[1]['data'])['auth']['password'], "secret-password")
+
+    @patch("requests.Session.post")
+    def test_success_logged_at_info_only_when_enabled(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+        sdk = FmailerSdk("test", "test", log_level=logging.INFO)
+        with self.assertNoLogs("fmailersdk.sdk", level=logging.INFO):
+            sdk.send_simple(faker.email(), faker.email(), "Test", "<p>Test</p>")
+
+        sdk = FmailerSdk("test", "test", log_level=logging.INFO, log_success=True)
+        recipient = faker.email()
+        with self.assertLogs("fmailersdk.sdk", level=logging.INFO) as logs:
+            sdk.send_simple(recipient, faker.email(), "Test", "<p>Test</p>")
+        self.assertIn(f"sent successfully to {recipient}", logs.output[0])
+
+    @patch("requests.Session.post")
+    def test_dedupe_window_skips_repeated_idempotency_keys(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+        sdk = FmailerSdk("test", "test", dedupe_window=60)
+        recipient = faker.email()
+        self.assertTrue(sdk.send_simple(recipient, faker.email(), "Test", "<p>Test</p>", "key-1"))
+        self.assertTrue(sdk.send_simple(recipient, faker.email(), "Test", "<p>Test</p>", "key-1"))
+        self.assertEqual(mock_post.call_count, 1)
+
+        # Keys without a window, other keys and expired keys are sent
+        sdk.send("test", recipient, faker.email(), idempotency_key="key-2")
+        self.assertEqual(mock_post.call_count, 2)
+        with patch("time.monotonic", return_value=time.monotonic() + 61):
+            sdk.send_simple(recipient, faker.email(), "Test", "<p>Test</p>", "key-1")
+        self.assertEqual(mock_post.call_count, 3)
+
+        FmailerSdk("test", "test").send_simple(recipient, faker.email(), "Test", "<p>Test</p>", "key-1")
+        self.assertEqual(mock_post.call_count, 4)
+
+    @patch("requests.Session.post")
+    def test_dedupe_window_ignores_failed_sends(self, mock_post):
+        mock_post.return_value.ok = False
+        mock_post.return_value.status_code = 500
+        mock_post.return_value.content = b"Internal Server Error"
+        sdk = FmailerSdk("test", "test", dedupe_window=60)
+        for _ in range(2):
+            with self.assertRaises(FmailerSdkException):
+                sdk.send("test", faker.email(), faker.email(), idempotency_key="key-1")
+        self.assertEqual(mock_post.call_count, 2)
+
+    @patch("requests.Session.post")
+    def test_send_gzips_large_bodies(self, mock_post):
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+        sdk = FmailerSdk("test", "test", gzip_threshold=1024)
+        params = {"content": "<p>Hello!</p>" * 200}
+
+        sdk.send("test", faker.email(), faker.email(), "en", params)
+        call_kwargs = mock_post.call_args[1]
+        self.assertEqual(call_kwargs['headers']['Content-Encoding'], "gzip")
+        self.assertEqual(orjson.loads(gzip.decompress(call_kwargs['data']))['params'], params)
+
+        sdk.send("test", faker.email(), faker.email(), "en", {"name": "John"})
+        call_kwargs = mock_post.call_args[1]
+        self.assertIsNone(call_kwargs['headers'])
+        self.assertEqual(orjson.loads(call_kwargs['data'])['params'], {"name": "John"})
+
+        FmailerSdk("test", "test").send("test", faker.email(), faker.email(), "en", params)
+        self.assertIsNone(mock_post.call_args[1]['headers'])
+
+    @patch("requests.Session.post")
     def test_send_simple_exception_400(self, mock_post):
         mock_post.return_value.status_code = 400
         mock_post.return_value.ok = False
-        mock_post.return_value.text = {"err": "error"}
+        mock_post.return_value.content = b'{"err": "error"}'
         sdk = FmailerSdk("test", "test")
         with self.assertRaises(FmailerSdkException) as context:
             res = sdk.send("test", faker.email(), faker.email(), "ru", {}, "")
         self.assertIn("err", str(context.exception))
+        self.assertEqual(context.exception.status_code, 400)
 
 
 class FmailersdkAsyncTestUtils(unittest.TestCase):
@@ -41,7 +343,7 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         if hasattr(self, 'sdk') and self.sdk:
             self.sdk.shutdown(wait=True)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_send_simple_async_success(self, mock_post):
         """Test send_simple_async returns a Future and completes successfully"""
         mock_post.return_value.ok = True
@@ -68,12 +370,12 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         self.assertTrue(result)
         mock_post.assert_called_once()
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_send_async_success(self, mock_post):
         """Test send_async returns a Future and completes successfully"""
         mock_post.return_value.ok = True
         mock_post.return_value.status_code = 200
-        mock_post.return_value.text = "OK"
+        mock_post.return_value.content = b"OK"
 
         sdk = FmailerSdk("test", "test")
         self.sdk = sdk
@@ -97,7 +399,7 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         self.assertTrue(result)
         mock_post.assert_called_once()
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_send_simple_async_with_callback_success(self, mock_post):
         """Test send_simple_async callback is called on success"""
         mock_post.return_value.ok = True
@@ -126,12 +428,12 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         self.assertTrue(args[0])  # result should be True
         self.assertIsNone(args[1])  # error should be None
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_send_async_with_callback_success(self, mock_post):
         """Test send_async callback is called on success"""
         mock_post.return_value.ok = True
         mock_post.return_value.status_code = 200
-        mock_post.return_value.text = "OK"
+        mock_post.return_value.content = b"OK"
 
         sdk = FmailerSdk("test", "test")
         self.sdk = sdk
@@ -155,7 +457,25 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         self.assertTrue(args[0])  # result should be True
         self.assertIsNone(args[1])  # error should be None
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
+    def test_callback_runs_inline_on_worker_thread(self, mock_post):
+        """Test the callback is invoked by the task itself, before its future resolves"""
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+
+        sdk = FmailerSdk("test", "test")
+        self.sdk = sdk
+
+        calls = []
+        callback = lambda result, error: calls.append((threading.current_thread().name, result, error))
+        future = sdk.send_simple_async(faker.email(), faker.email(), "Test", "<p>Test</p>", callback=callback)
+
+        self.assertTrue(future.result(timeout=5))
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(calls[0][0].startswith("fmailer"))
+        self.assertEqual(calls[0][1:], (True, None))
+
+    @patch("requests.Session.post")
     def test_send_simple_async_with_callback_error(self, mock_post):
         """Test send_simple_async callback is called on error"""
         mock_post.side_effect = requests.exceptions.ConnectionError()
@@ -185,12 +505,12 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         self.assertIsNotNone(args[1])  # error should be present
         self.assertIsInstance(args[1], FmailerSdkException)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_send_async_with_callback_error(self, mock_post):
         """Test send_async callback is called on error"""
         mock_post.return_value.ok = False
         mock_post.return_value.status_code = 400
-        mock_post.return_value.text = "Bad Request"
+        mock_post.return_value.content = b"Bad Request"
 
         sdk = FmailerSdk("test", "test")
         self.sdk = sdk
@@ -215,7 +535,7 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         self.assertFalse(args[0])  # result should be False
         self.assertIsNotNone(args[1])  # error should be present
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_send_simple_async_exception(self, mock_post):
         """Test send_simple_async propagates exceptions"""
         mock_post.side_effect = requests.exceptions.ConnectionError()
@@ -234,12 +554,12 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         with self.assertRaises(FmailerSdkException):
             future.result(timeout=5)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_send_async_exception(self, mock_post):
         """Test send_async propagates exceptions"""
         mock_post.return_value.ok = False
         mock_post.return_value.status_code = 500
-        mock_post.return_value.text = "Internal Server Error"
+        mock_post.return_value.content = b"Internal Server Error"
 
         sdk = FmailerSdk("test", "test")
         self.sdk = sdk
@@ -254,7 +574,7 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         with self.assertRaises(FmailerSdkException):
             future.result(timeout=5)
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_multiple_async_requests_concurrent(self, mock_post):
         """Test multiple async requests execute concurrently"""
         mock_post.return_value.ok = True
@@ -283,7 +603,180 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         self.assertTrue(all(results))
         self.assertEqual(mock_post.call_count, 5)
 
-    @patch("requests.post")
+    def test_async_sends_reuse_session_connections(self):
+        """Test worker threads share the instance's keep-alive connection pool"""
+        url, client_ports = _start_server(self, delay=0.05)
+
+        with patch.object(FmailerSdk, "_pool", None), patch.object(FmailerSdk, "_pool_refs", 0), \
+                patch.object(FmailerSdk, "SERVER_URL", url):
+            # A wider instance grows the shared executor beyond the connection pool of the next one
+            wide = FmailerSdk("test", "test", max_workers=8)
+            sdk = FmailerSdk("test", "test", max_workers=2)
+            self.assertEqual(sdk._executor._max_workers, 8)
+
+            futures = [
+                sdk.send_simple_async(faker.email(), faker.email(), "Test", "<p>Test</p>")
+                for _ in range(8)
+            ]
+            self.assertTrue(all(f.result(timeout=5) for f in futures))
+            # Release the isolated pool while it is still the patched one
+            sdk.shutdown()
+            wide.shutdown()
+
+        self.assertEqual(len(client_ports), 8)
+        self.assertLessEqual(len(set(client_ports)), 2)
+
+    @patch("requests.Session.post")
+    def test_async_request_encoded_on_caller_thread(self, mock_post):
+        """Test send_async encodes the body before submitting, leaving only the POST to the worker"""
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+        encode_threads = []
+        post_threads = []
+        mock_post.side_effect = lambda *args, **kwargs: post_threads.append(threading.current_thread()) or mock_post.return_value
+
+        sdk = FmailerSdk("test", "test")
+        self.sdk = sdk
+        encode = sdk._encode
+        sdk._encode = lambda payload: encode_threads.append(threading.current_thread()) or encode(payload)
+
+        future = sdk.send_async("test", faker.email(), faker.email(), "en", {"name": "John"})
+        self.assertTrue(future.result(timeout=5))
+
+        self.assertEqual(encode_threads, [threading.current_thread()])
+        self.assertEqual(len(post_threads), 1)
+        self.assertIsNot(post_threads[0], threading.current_thread())
+        self.assertEqual(orjson.loads(mock_post.call_args[1]['data'])['params'], {"name": "John"})
+
+    @patch("requests.Session.post")
+    def test_send_bulk_async_single_request(self, mock_post):
+        """Test send_bulk_async sends all messages in one request"""
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+
+        sdk = FmailerSdk("test", "test")
+        self.sdk = sdk
+
+        callback = Mock()
+        messages = [
+            {"recipient": faker.email(), "sender": faker.email(), "subject": f"Test {i}", "body": "<p>Test</p>"}
+            for i in range(5)
+        ]
+        future = sdk.send_bulk_async(messages, callback=callback)
+
+        self.assertEqual(future.result(timeout=5), [True] * 5)
+        self.assertEqual(mock_post.call_count, 1)
+        callback.assert_called_once_with([True] * 5, None)
+
+    @patch("requests.Session.post")
+    def test_submission_blocks_when_pipeline_saturated(self, mock_post):
+        """Test send_*_async applies backpressure once max_workers * 4 tasks are pending"""
+        def slow_response(*args, **kwargs):
+            time.sleep(0.2)
+            response = Mock()
+            response.ok = True
+            response.status_code = 200
+            return response
+
+        mock_post.side_effect = slow_response
+
+        sdk = FmailerSdk("test", "test", max_workers=1)
+        self.sdk = sdk
+
+        def send():
+            return sdk.send_simple_async(
+                recipient=faker.email(),
+                sender=faker.email(),
+                subject="Test",
+                body="<p>Test</p>"
+            )
+
+        start_time = time.time()
+        futures = [send() for _ in range(4)]
+        self.assertLess(time.time() - start_time, 0.1)
+
+        # Fifth submission waits for the first task to finish
+        futures.append(send())
+        self.assertGreaterEqual(time.time() - start_time, 0.15)
+
+        self.assertTrue(all(f.result(timeout=5) for f in futures))
+
+    @patch("requests.Session.post")
+    def test_non_blocking_submission_raises_when_pipeline_saturated(self, mock_post):
+        """Test send_*_async(block=False) raises instead of waiting for a free slot"""
+        release = threading.Event()
+
+        def blocked_response(*args, **kwargs):
+            release.wait(5)
+            response = Mock()
+            response.ok = True
+            response.status_code = 200
+            return response
+
+        mock_post.side_effect = blocked_response
+
+        sdk = FmailerSdk("test", "test", max_workers=1)
+        self.sdk = sdk
+
+        futures = [
+            sdk.send_simple_async(faker.email(), faker.email(), "Test", "<p>Test</p>", block=False)
+            for _ in range(4)
+        ]
+        start_time = time.time()
+        with self.assertRaises(FmailerSdkException) as context:
+            sdk.send_async("test", faker.email(), faker.email(), block=False)
+        self.assertLess(time.time() - start_time, 0.1)
+        self.assertIn("queue is full", str(context.exception))
+
+        release.set()
+        self.assertTrue(all(f.result(timeout=5) for f in futures))
+
+    @patch("requests.Session.post")
+    def test_callback_can_submit_follow_up_when_pipeline_saturated(self, mock_post):
+        """Test a callback queueing a follow-up send does not deadlock a full pipeline"""
+        def slow_response(*args, **kwargs):
+            time.sleep(0.05)
+            response = Mock()
+            response.ok = True
+            response.status_code = 200
+            return response
+
+        mock_post.side_effect = slow_response
+
+        sdk = FmailerSdk("test", "test", max_workers=1)
+        self.sdk = sdk
+
+        follow_ups = []
+        lock = threading.Lock()
+
+        def callback(result, error):
+            with lock:
+                follow_ups.append(sdk.send_simple_async(faker.email(), faker.email(), "Follow-up", "<p>Test</p>"))
+
+        futures = []
+
+        def produce():
+            # The fifth send competes with the callbacks for the freed slots
+            for _ in range(5):
+                futures.append(sdk.send_simple_async(faker.email(), faker.email(), "Test", "<p>Test</p>", callback=callback))
+
+        # Submit from a daemon thread so a deadlock fails the test instead of hanging it
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+        producer.join(5)
+        self.assertFalse(producer.is_alive())
+
+        self.assertTrue(all(f.result(timeout=5) for f in futures))
+        with lock:
+            pending = list(follow_ups)
+        self.assertEqual(len(pending), 5)
+        self.assertTrue(all(f.result(timeout=5) for f in pending))
+
+        # Every slot is free again once all tasks have finished
+        sdk.shutdown(wait=True)
+        self.assertEqual(sdk._inflight._value, 4)
+
+    @patch("requests.Session.post")
     def test_future_done_method(self, mock_post):
         """Test Future.done() method works correctly"""
         # Simulate slow request
@@ -315,14 +808,15 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         # Should be done now
         self.assertTrue(future.done())
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_executor_initialization(self, mock_post):
-        """Test executor is lazily initialized"""
+        """Test executor is initialized eagerly with the requested capacity"""
         sdk = FmailerSdk("test", "test", max_workers=10)
         self.sdk = sdk
 
-        # Executor should not be created yet
-        self.assertIsNone(sdk._executor)
+        # Executor is assigned at construction
+        self.assertIsNotNone(sdk._executor)
+        self.assertGreaterEqual(sdk._executor._max_workers, 10)
 
         # Make a request
         mock_post.return_value.ok = True
@@ -335,13 +829,10 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
             body="<p>Test</p>"
         )
 
-        # Now executor should exist
-        self.assertIsNotNone(sdk._executor)
-
         # Wait for completion
-        future.result(timeout=5)
+        self.assertTrue(future.result(timeout=5))
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_shutdown_waits_for_completion(self, mock_post):
         """Test shutdown waits for pending tasks"""
         def slow_response(*args, **kwargs):
@@ -374,7 +865,7 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         # Task should be done
         self.assertTrue(future.done())
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_shutdown_without_wait(self, mock_post):
         """Test shutdown without waiting for completion"""
         def slow_response(*args, **kwargs):
@@ -404,7 +895,216 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
         # Should return quickly (less than 0.1 seconds)
         self.assertLess(elapsed, 0.1)
 
-    @patch("requests.post")
+        # Let the task finish while requests are still mocked
+        future.result(timeout=5)
+
+    @patch("requests.Session.post")
+    def test_shutdown_cancels_queued_futures(self, mock_post):
+        """Test shutdown(cancel_futures=True) cancels tasks that have not started"""
+        started = threading.Event()
+        release = threading.Event()
+
+        def blocked_response(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            response = Mock()
+            response.ok = True
+            response.status_code = 200
+            return response
+
+        mock_post.side_effect = blocked_response
+
+        with patch.object(FmailerSdk, "_pool", None), patch.object(FmailerSdk, "_pool_refs", 0):
+            sdk = FmailerSdk("test", "test", max_workers=1)
+            running = sdk.send_simple_async(faker.email(), faker.email(), "Test", "<p>Test</p>")
+            callback = Mock()
+            queued = sdk.send_simple_async(faker.email(), faker.email(), "Test", "<p>Test</p>", callback=callback)
+            self.assertTrue(started.wait(5))
+
+            sdk.shutdown(wait=False, cancel_futures=True)
+            self.assertTrue(queued.cancelled())
+
+            release.set()
+            self.assertTrue(running.result(timeout=5))
+        self.assertEqual(mock_post.call_count, 1)
+        callback.assert_not_called()
+
+    @patch("requests.Session.post")
+    def test_context_manager_waits_for_completion(self, mock_post):
+        """Test leaving the with block shuts down and waits for pending tasks"""
+        def slow_response(*args, **kwargs):
+            time.sleep(0.2)
+            response = Mock()
+            response.ok = True
+            response.status_code = 200
+            return response
+
+        mock_post.side_effect = slow_response
+
+        with FmailerSdk("test", "test") as sdk:
+            future = sdk.send_simple_async(
+                recipient=faker.email(),
+                sender=faker.email(),
+                subject="Test",
+                body="<p>Test</p>"
+            )
+
+        self.assertTrue(future.done())
+        self.assertEqual(sdk._futures, set())
+
+    def test_shared_executor_grows_and_shuts_down_with_last_instance(self):
+        """Test the shared executor grows in place and is refcounted by SDK instances"""
+        with patch.object(FmailerSdk, "_pool", None), patch.object(FmailerSdk, "_pool_refs", 0):
+            first = FmailerSdk("test", "test", max_workers=2)
+            second = FmailerSdk("test", "test", max_workers=6)
+            pool = first._executor
+            self.assertIs(second._executor, pool)
+            self.assertEqual(pool._max_workers, 6)
+
+            # Repeated shutdown() only releases the instance's reference once
+            second.shutdown()
+            second.shutdown()
+            self.assertIs(FmailerSdk._pool, pool)
+            self.assertFalse(pool._shutdown)
+
+            first.shutdown()
+            self.assertIsNone(FmailerSdk._pool)
+            self.assertTrue(pool._shutdown)
+
+    @patch("requests.Session.post")
+    def test_async_send_after_shutdown_reacquires_executor(self, mock_post):
+        """Test an instance stays usable after shutdown() released the last pool reference"""
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+
+        with patch.object(FmailerSdk, "_pool", None), patch.object(FmailerSdk, "_pool_refs", 0):
+            sdk = FmailerSdk("test", "test", max_workers=2)
+            first_pool = sdk._executor
+            sdk.shutdown()
+            self.assertTrue(first_pool._shutdown)
+
+            future = sdk.send_simple_async(faker.email(), faker.email(), "Test", "<p>Test</p>")
+            self.assertTrue(future.result(timeout=5))
+            self.assertIsNot(sdk._executor, first_pool)
+            self.assertIs(FmailerSdk._pool, sdk._executor)
+            self.assertEqual(FmailerSdk._pool_refs, 1)
+
+            sdk.shutdown()
+            self.assertIsNone(FmailerSdk._pool)
+
+    @patch("requests.Session.post")
+    def test_subclass_shares_executor_refcount(self, mock_post):
+        """Test subclasses count their references on the same shared pool as FmailerSdk"""
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+
+        class ProxySdk(FmailerSdk):
+            SERVER_URL = "http://127.0.0.1:8080"
+
+        with patch.object(FmailerSdk, "_pool", None), patch.object(FmailerSdk, "_pool_refs", 0):
+            base = FmailerSdk("test", "test", max_workers=2)
+            sub = ProxySdk("test", "test", max_workers=2)
+            self.assertIs(sub._executor, base._executor)
+            self.assertEqual(FmailerSdk._pool_refs, 2)
+            self.assertNotIn("_pool_refs", ProxySdk.__dict__)
+            self.assertNotIn("_pool", ProxySdk.__dict__)
+
+            # The subclass reference keeps the pool alive after the base instance is shut down
+            base.shutdown()
+            self.assertFalse(sub._executor._shutdown)
+            future = sub.send_simple_async(faker.email(), faker.email(), "Test", "<p>Test</p>")
+            self.assertTrue(future.result(timeout=5))
+
+            sub.shutdown()
+            self.assertIsNone(FmailerSdk._pool)
+            self.assertEqual(FmailerSdk._pool_refs, 0)
+
+    def test_collected_instance_releases_executor(self):
+        """Test an instance that is never shut down drops its pool reference when collected"""
+        with patch.object(FmailerSdk, "_pool", None), patch.object(FmailerSdk, "_pool_refs", 0):
+            kept = FmailerSdk("test", "test", max_workers=2)
+            dropped = FmailerSdk("test", "test", max_workers=2)
+            pool = kept._executor
+
+            del dropped
+            gc.collect()
+            self.assertEqual(FmailerSdk._pool_refs, 1)
+            self.assertFalse(pool._shutdown)
+
+            del kept
+            gc.collect()
+            self.assertIsNone(FmailerSdk._pool)
+            self.assertTrue(pool._shutdown)
+
+    def test_finalizer_during_pool_logging_does_not_deadlock(self):
+        """Test a collected instance's finalizer can run while the pool is being acquired"""
+        class CollectingHandler(logging.Handler):
+            def emit(self, record):
+                gc.collect()
+
+        sdk_logger = logging.getLogger("fmailersdk.sdk")
+        handler = CollectingHandler()
+        sdk_logger.addHandler(handler)
+        self.addCleanup(sdk_logger.removeHandler, handler)
+        sdk_logger.setLevel(logging.INFO)
+
+        with patch.object(FmailerSdk, "_pool", None), patch.object(FmailerSdk, "_pool_refs", 0):
+            gc.disable()
+            try:
+                cyclic = FmailerSdk("test", "test", max_workers=2)
+                cyclic.cycle = cyclic
+                pool = cyclic._executor
+                del cyclic
+
+                # Growing the pool logs, and the handler collects the cyclic instance
+                created = []
+                worker = threading.Thread(target=lambda: created.append(FmailerSdk("test", "test", max_workers=4)), daemon=True)
+                worker.start()
+                worker.join(5)
+            finally:
+                gc.enable()
+            self.assertFalse(worker.is_alive())
+
+            self.assertEqual(FmailerSdk._pool_refs, 1)
+            self.assertIs(created[0]._executor, pool)
+            self.assertFalse(pool._shutdown)
+            created[0].shutdown()
+            self.assertTrue(pool._shutdown)
+
+    @patch("requests.Session.post")
+    def test_executor_shared_between_instances(self, mock_post):
+        """Test SDK instances share one executor and shutdown only drains own tasks"""
+        def slow_response(*args, **kwargs):
+            time.sleep(0.3)
+            response = Mock()
+            response.ok = True
+            response.status_code = 200
+            return response
+
+        mock_post.side_effect = slow_response
+
+        first = FmailerSdk("test", "test", max_workers=2)
+        second = FmailerSdk("test", "test", max_workers=2)
+        self.sdk = second
+
+        slow_future = first.send_simple_async(
+            recipient=faker.email(),
+            sender=faker.email(),
+            subject="Test",
+            body="<p>Test</p>"
+        )
+        self.assertIs(first._executor, second._executor)
+
+        # second has nothing pending, so shutdown returns without waiting for first's task
+        start_time = time.time()
+        second.shutdown(wait=True)
+        self.assertLess(time.time() - start_time, 0.1)
+        self.assertFalse(slow_future.done())
+
+        first.shutdown(wait=True)
+        self.assertTrue(slow_future.done())
+
+    @patch("requests.Session.post")
     def test_fail_silently_async(self, mock_post):
         """Test fail_silently works with async methods"""
         mock_post.side_effect = requests.exceptions.ConnectionError()
@@ -419,16 +1119,17 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
             body="<p>Test</p>"
         )
 
-        # Should not raise exception due to fail_silently
+        # Should not raise exception due to fail_silently, but report the failure
         result = future.result(timeout=5)
-        self.assertTrue(result)
+        self.assertFalse(result)
+        self.assertFalse(sdk.send_simple(faker.email(), faker.email(), "Test", "<p>Test</p>"))
 
-    @patch("requests.post")
+    @patch("requests.Session.post")
     def test_async_methods_preserve_sync_behavior(self, mock_post):
         """Test that async methods call the sync methods correctly"""
         mock_post.return_value.ok = True
         mock_post.return_value.status_code = 200
-        mock_post.return_value.text = "OK"
+        mock_post.return_value.content = b"OK"
 
         sdk = FmailerSdk("test", "test")
         self.sdk = sdk
@@ -447,13 +1148,134 @@ class FmailersdkAsyncTestUtils(unittest.TestCase):
 
         future.result(timeout=5)
 
-        # Verify the underlying requests.post was called with correct data
+        # Verify the underlying session post was called with correct data
         self.assertEqual(mock_post.call_count, 1)
         call_kwargs = mock_post.call_args[1]
-        payload = call_kwargs['json']
+        payload = orjson.loads(call_kwargs['data'])
 
         self.assertEqual(payload['recipient'], recipient)
         self.assertEqual(payload['sender'], sender)
         self.assertEqual(payload['subject'], "Test Subject")
         self.assertEqual(payload['body'], "<p>Test Body</p>")
         self.assertEqual(payload['idempotency_key'], "test-key")
+
+
+class FmailersdkCoroutineTestUtils(unittest.IsolatedAsyncioTestCase):
+    """Tests for FmailerSdk coroutine methods running on the thread pool"""
+
+    @patch("requests.Session.post")
+    async def test_send_simple_asyncio_uses_executor(self, mock_post):
+        """Test send_simple_asyncio runs the sync send on the SDK executor"""
+        mock_post.return_value.ok = True
+        mock_post.return_value.status_code = 200
+
+        sdk = FmailerSdk("test", "test")
+        self.addCleanup(sdk.shutdown)
+
+        callback = Mock()
+        result = await sdk.send_simple_asyncio(
+            recipient=faker.email(),
+            sender=faker.email(),
+            subject="Test",
+            body="<p>Test</p>",
+            callback=callback
+        )
+
+        self.assertTrue(result)
+        self.assertIsNotNone(sdk._executor)
+        mock_post.assert_called_once()
+        callback.assert_called_once_with(True, None)
+
+    @patch("requests.Session.post")
+    async def test_send_asyncio_exception(self, mock_post):
+        """Test send_asyncio propagates API errors"""
+        mock_post.return_value.ok = False
+        mock_post.return_value.status_code = 500
+        mock_post.return_value.content = b"Internal Server Error"
+
+        sdk = FmailerSdk("test", "test")
+        self.addCleanup(sdk.shutdown)
+
+        with self.assertRaises(FmailerSdkException):
+            await sdk.send_asyncio("test", faker.email(), faker.email())
+
+
+class AsyncFmailersdkTestUtils(unittest.IsolatedAsyncioTestCase):
+    """Tests for the httpx-based AsyncFmailerSdk"""
+
+    async def asyncTearDown(self):
+        if hasattr(self, 'sdk') and self.sdk:
+            await self.sdk.aclose()
+
+    @patch("httpx.AsyncHTTPTransport.handle_async_request", new_callable=AsyncMock)
+    async def test_send_simple_async_success(self, mock_request):
+        """Test send_simple_async posts the payload and returns True"""
+        mock_request.return_value = httpx.Response(200, content=b"OK")
+
+        sdk = AsyncFmailerSdk("test", "test")
+        self.sdk = sdk
+
+        recipient = faker.email()
+        coro = sdk.send_simple_async(
+            recipient=recipient,
+            sender=faker.email(),
+            subject="Test",
+            body="<p>Test</p>",
+            idempotency_key="test-key"
+        )
+        # The public method hands back the request coroutine without a wrapping layer
+        self.assertFalse(inspect.iscoroutinefunction(AsyncFmailerSdk.send_simple_async))
+        self.assertTrue(inspect.iscoroutine(coro))
+        result = await coro
+
+        self.assertTrue(result)
+        mock_request.assert_awaited_once()
+        request = mock_request.call_args[0][0]
+        self.assertEqual(request.headers["Content-Type"], "application/json")
+        payload = orjson.loads(request.content)
+        self.assertEqual(payload['recipient'], recipient)
+        self.assertEqual(payload['idempotency_key'], "test-key")
+
+    @patch("httpx.AsyncHTTPTransport.handle_async_request", new_callable=AsyncMock)
+    async def test_send_async_exception_400(self, mock_request):
+        """Test send_async raises on non-2xx responses via the response hook"""
+        mock_request.return_value = httpx.Response(400, content=b"Bad Request")
+
+        sdk = AsyncFmailerSdk("test", "test")
+        self.sdk = sdk
+
+        with self.assertRaises(FmailerSdkException) as context:
+            await sdk.send_async("test", faker.email(), faker.email())
+        self.assertIn("Bad Request", str(context.exception))
+        self.assertEqual(context.exception.status_code, 400)
+
+    @patch("httpx.AsyncHTTPTransport.handle_async_request", new_callable=AsyncMock)
+    async def test_response_check_independent_of_log_level(self, mock_request):
+        """Test a 3xx response gives the same result with and without DEBUG logging"""
+        sdk = AsyncFmailerSdk("test", "test")
+        self.sdk = sdk
+        logger = logging.getLogger("fmailersdk.sdk")
+        self.addCleanup(logger.setLevel, logger.level)
+
+        for level in (logging.INFO, logging.DEBUG):
+            logger.setLevel(level)
+            mock_request.return_value = httpx.Response(304, content=b"")
+            self.assertTrue(await sdk.send_async("test", faker.email(), faker.email()))
+
+    @patch("httpx.AsyncHTTPTransport.handle_async_request", new_callable=AsyncMock)
+    async def test_send_async_fail_silently(self, mock_request):
+        """Test send_async honours fail_silently on network errors"""
+        mock_request.side_effect = httpx.ConnectError("boom")
+
+        sdk = AsyncFmailerSdk("test", "test", fail_silently=True)
+        self.sdk = sdk
+
+        result = await sdk.send_async("test", faker.email(), faker.email())
+        self.assertFalse(result)
+
+    async def test_context_manager_closes_client(self):
+        """Test async with closes the httpx.AsyncClient on exit"""
+        async with AsyncFmailerSdk("test", "test") as sdk:
+            client = sdk._client
+            self.assertFalse(client.is_closed)
+        self.assertTrue(client.is_closed)